@@ -6,7 +6,6 @@ import atexit
 import logging
 import os
 import re
-import subprocess
 import sys
 from functools import lru_cache
 from importlib import import_module
@@ -14,7 +13,6 @@ from pathlib import Path
 
 import jpype
 import jpype.config
-from jgo import jgo
 
 import scyjava.config
 from scyjava.config import Mode, mode
@@ -91,10 +89,16 @@ def jvm_version() -> str:
     if java is None:
         raise RuntimeError(f"No java executable found inside: {p}")
 
+    import subprocess
+
     try:
-        output = subprocess.check_output(
-            [str(java), "-version"], stderr=subprocess.STDOUT
-        ).decode()
+        output = subprocess.run(
+            [str(java), "-version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            check=True,
+        ).stdout
     except subprocess.CalledProcessError as e:
         raise RuntimeError("System call to java failed") from e
 
@@ -124,25 +128,24 @@ def start_jvm(options=None) -> None:
 
     assert mode == Mode.JPYPE
 
-    # retrieve endpoint and repositories from scyjava config
+    # retrieve endpoints from scyjava config
     endpoints = scyjava.config.endpoints
-    repositories = scyjava.config.get_repositories()
 
     # use the logger to notify user that endpoints are being added
     _logger.debug("Adding jars from endpoints {0}".format(endpoints))
 
     # get endpoints and add to JPype class path
     if len(endpoints) > 0:
-        endpoints = endpoints[:1] + sorted(endpoints[1:])
-        _logger.debug("Using endpoints %s", endpoints)
-        _, workspace = jgo.resolve_dependencies(
-            "+".join(endpoints),
-            m2_repo=scyjava.config.get_m2_repo(),
-            cache_dir=scyjava.config.get_cache_dir(),
-            manage_dependencies=scyjava.config.get_manage_deps(),
-            repositories=repositories,
-            verbose=scyjava.config.get_verbose(),
-            shortcuts=scyjava.config.get_shortcuts(),
+        # NB: Only look up repositories here; doing so imports jgo.
+        repositories = scyjava.config.get_repositories()
+        workspace = _resolve_workspace(
+            tuple(endpoints),
+            tuple(repositories.items()),
+            scyjava.config.get_m2_repo(),
+            scyjava.config.get_cache_dir(),
+            scyjava.config.get_manage_deps(),
+            scyjava.config.get_verbose(),
+            tuple(scyjava.config.get_shortcuts().items()),
         )
         jpype.addClassPath(os.path.join(workspace, "*"))
 
@@ -154,26 +157,27 @@ def start_jvm(options=None) -> None:
     ):
         _logger.debug("JAVA_HOME not set. Will try to infer it from sys.path.")
 
-        libjvm_win = Path("Library") / "jre" / "bin" / "server" / "jvm.dll"
-        libjvm_macos = Path("lib") / "server" / "libjvm.dylib"
-        libjvm_linux = Path("lib") / "server" / "libjvm.so"
         libjvm_paths = {
-            libjvm_win: Path("Library"),
-            libjvm_macos: Path(),
-            libjvm_linux: Path(),
+            os.path.join("Library", "jre", "bin", "server", "jvm.dll"): "Library",
+            os.path.join("lib", "server", "libjvm.dylib"): "",
+            os.path.join("lib", "server", "libjvm.so"): "",
         }
+        java_home = None
         for p in sys.path:
             if not p.endswith("site-packages"):
                 continue
             # e.g. $CONDA_PREFIX/lib/python3.10/site-packages -> $CONDA_PREFIX
             # But we want it to work outside of Conda as well, theoretically.
-            base = Path(p).parent.parent.parent
+            base = os.path.dirname(os.path.dirname(os.path.dirname(p)))
             for libjvm_path, java_home_path in libjvm_paths.items():
-                if (base / libjvm_path).exists():
-                    java_home = str((base / java_home_path).resolve())
-                    _logger.debug(f"Detected JAVA_HOME: {java_home}")
-                    os.environ["JAVA_HOME"] = java_home
+                if os.path.exists(os.path.join(base, libjvm_path)):
+                    java_home = os.path.realpath(os.path.join(base, java_home_path))
                     break
+            if java_home is not None:
+                break
+        if java_home is not None:
+            _logger.debug(f"Detected JAVA_HOME: {java_home}")
+            os.environ["JAVA_HOME"] = java_home
 
     # initialize JPype JVM
     _logger.debug("Starting JVM")
@@ -186,8 +190,10 @@ def start_jvm(options=None) -> None:
     jpype.config.free_resources = False
     atexit.register(shutdown_jvm)
 
-    # invoke registered callback functions
-    for callback in _startup_callbacks:
+    # invoke registered callback functions, releasing them as we go
+    callbacks = tuple(_startup_callbacks)
+    _startup_callbacks.clear()
+    for callback in callbacks:
         callback()
 
 
@@ -220,12 +226,14 @@ def shutdown_jvm() -> None:
 
     assert mode == Mode.JPYPE
 
-    # invoke registered shutdown callback functions
-    for callback in _shutdown_callbacks:
+    # invoke registered shutdown callback functions, releasing them as we go
+    callbacks = tuple(_shutdown_callbacks)
+    _shutdown_callbacks.clear()
+    for callback in callbacks:
         try:
             callback()
-        except Exception as e:
-            print(f"Exception during shutdown callback: {e}")
+        except Exception:
+            _logger.exception("Exception during shutdown callback")
 
     # dispose AWT resources if applicable
     if is_awt_initialized():
@@ -236,18 +244,23 @@ def shutdown_jvm() -> None:
     # okay to shutdown JVM
     try:
         jpype.shutdownJVM()
-    except Exception as e:
-        print(f"Exception during JVM shutdown: {e}")
+    except Exception:
+        _logger.exception("Exception during JVM shutdown")
 
 
-def jvm_started() -> bool:
-    """Return true iff a Java virtual machine (JVM) has been started."""
-    if mode == Mode.JEP:
+# NB: The mode never changes after import, so we pick the implementation once
+# here, rather than checking the mode on every call of this hot function.
+if mode == Mode.JEP:
+
+    def jvm_started() -> bool:
+        """Return true iff a Java virtual machine (JVM) has been started."""
         return True
 
-    assert mode == Mode.JPYPE
+else:
 
-    return jpype.isJVMStarted()
+    def jvm_started() -> bool:
+        """Return true iff a Java virtual machine (JVM) has been started."""
+        return jpype.isJVMStarted()
 
 
 def gc() -> None:
@@ -389,24 +402,66 @@ def when_jvm_stops(f) -> None:
     _shutdown_callbacks.append(f)
 
 
-@lru_cache(maxsize=None)
-def jimport(class_name: str):
+# NB: The underlying lookups are cached too -- by JPype, or by sys.modules
+# for Jep's import_module -- so in either mode, evicting an entry here only
+# costs one extra lookup, while keeping memory use bounded.
+if mode == Mode.JEP:
+
+    @lru_cache(maxsize=512)
+    def jimport(class_name: str):
+        """
+        Import a class from Java to Python.
+
+        :param class_name: Name of the class to import.
+        :return:
+            A pointer to the class, which can be used to
+            e.g. instantiate objects of that class.
+        """
+        module_name, simple_name = class_name.rsplit(".", 1)
+        module = import_module(module_name, simple_name)
+        return getattr(module, simple_name)
+
+else:
+
+    @lru_cache(maxsize=512)
+    def jimport(class_name: str):
+        """
+        Import a class from Java to Python.
+
+        :param class_name: Name of the class to import.
+        :return:
+            A pointer to the class, which can be used to
+            e.g. instantiate objects of that class.
+        """
+        if not jpype.isJVMStarted():
+            start_jvm()
+        return jpype.JClass(class_name)
+
+
+@lru_cache(maxsize=8)
+def _resolve_workspace(
+    endpoints, repositories, m2_repo, cache_dir, manage_deps, verbose, shortcuts
+) -> str:
     """
-    Import a class from Java to Python.
+    Resolve the given endpoints via jgo, returning the workspace directory.
 
-    :param class_name: Name of the class to import.
-    :return:
-        A pointer to the class, which can be used to
-        e.g. instantiate objects of that class.
+    All arguments must be hashable (dicts passed as tuples of items), so
+    that repeated resolutions of the same configuration are served from cache.
     """
-    if mode == Mode.JEP:
-        module_path = class_name.rsplit(".", 1)
-        module = import_module(module_path[0], module_path[1])
-        return getattr(module, module_path[1])
-
-    assert mode == Mode.JPYPE
-    start_jvm()
-    return jpype.JClass(class_name)
+    from jgo import jgo
+
+    endpoints = endpoints[:1] + tuple(sorted(endpoints[1:]))
+    _logger.debug("Using endpoints %s", endpoints)
+    _, workspace = jgo.resolve_dependencies(
+        "+".join(endpoints),
+        m2_repo=m2_repo,
+        cache_dir=cache_dir,
+        manage_dependencies=manage_deps,
+        repositories=dict(repositories),
+        verbose=verbose,
+        shortcuts=dict(shortcuts),
+    )
+    return workspace
 
 
 def _assert_jvm_started():
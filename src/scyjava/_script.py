@@ -7,9 +7,10 @@ https://github.com/scijava/scripting-python.
 
 import ast
 import sys
-import threading
 import traceback
-from contextlib import redirect_stdout
+from contextlib import nullcontext, redirect_stdout
+from functools import lru_cache
+from threading import get_ident
 
 from jpype import JImplements, JOverride
 
@@ -17,6 +18,101 @@ from scyjava._convert import to_java
 from scyjava._jvm import jimport
 
 
+class ScriptContextWriter:
+    def __init__(self, std):
+        self._std_default = std
+        self._thread_to_context = {}
+
+    def addScriptContext(self, scriptContext):
+        self._thread_to_context[get_ident()] = scriptContext
+
+    def removeScriptContext(self):
+        self._thread_to_context.pop(get_ident(), None)
+
+    def flush(self):
+        self._writer().flush()
+
+    def write(self, s):
+        self._writer().write(s)
+
+    def _writer(self):
+        ctx = self._thread_to_context.get(get_ident())
+        return self._std_default if ctx is None else ctx.getWriter()
+
+
+# NB: The proxy classes below are defined at module scope, so that JPype builds
+# their proxy glue only once. They are deferred because the JVM is typically
+# not yet running when this module is imported.
+
+
+@JImplements("java.util.function.Supplier", deferred=True)
+class PythonObjectSupplier:
+    def __init__(self, obj):
+        self.obj = obj
+
+    @JOverride
+    def get(self):
+        return self.obj
+
+
+@JImplements("java.util.function.Function", deferred=True)
+class PythonScriptRunner:
+    def __init__(self, stdoutContextWriter):
+        self._stdoutContextWriter = stdoutContextWriter
+        self._HashMap = jimport("java.util.HashMap")
+
+    @JOverride
+    def apply(self, arg):
+        _to_java = to_java
+
+        # Copy script bindings/vars into script locals.
+        script_locals = {
+            str(entry.getKey()): entry.getValue() for entry in arg.vars.entrySet()
+        }
+
+        self._stdoutContextWriter.addScriptContext(arg.scriptContext)
+
+        # NB: Without a script context, there is no writer to redirect to.
+        stdout_redirect = (
+            nullcontext()
+            if arg.scriptContext is None
+            else redirect_stdout(self._stdoutContextWriter)
+        )
+
+        return_value = None
+        with stdout_redirect:
+            try:
+                exec_code, eval_code = _compile_script(str(arg.script))
+                _globals = {}
+                exec(exec_code, _globals, script_locals)
+                if eval_code is not None:
+                    return_value = eval(eval_code, _globals, script_locals)
+            except Exception:
+                error_writer = (
+                    None
+                    if arg.scriptContext is None
+                    else arg.scriptContext.getErrorWriter()
+                )
+                if error_writer is not None:
+                    error_writer.write(_to_java(traceback.format_exc()))
+
+        self._stdoutContextWriter.removeScriptContext()
+
+        # Copy script locals back into script bindings/vars.
+        script_vars = self._HashMap(len(script_locals))
+        for key, value in script_locals.items():
+            try:
+                script_vars.put(key, _to_java(value))
+            except Exception:
+                script_vars.put(key, PythonObjectSupplier(value))
+                # error_writer = arg.scriptContext.getErrorWriter()
+                # if error_writer is not None:
+                #    error_writer.write(to_java(traceback.format_exc()))
+        arg.vars.putAll(script_vars)
+
+        return None if return_value is None else _to_java(return_value)
+
+
 def enable_python_scripting(context):
     """
     Adds a Python script runner object to the ObjectService of the given
@@ -27,98 +123,33 @@ def enable_python_scripting(context):
         where the PythonScriptRunner should be injected.
     """
     ObjectService = jimport("org.scijava.object.ObjectService")
-
-    class ScriptContextWriter:
-        def __init__(self, std):
-            self._std_default = std
-            self._thread_to_context = {}
-
-        def addScriptContext(self, thread, scriptContext):
-            self._thread_to_context[thread] = scriptContext
-
-        def removeScriptContext(self, thread):
-            if thread in self._thread_to_context:
-                del self._thread_to_context[thread]
-
-        def flush(self):
-            self._writer().flush()
-
-        def write(self, s):
-            self._writer().write(s)
-
-        def _writer(self):
-            ctx = self._thread_to_context.get(threading.currentThread())
-            return self._std_default if ctx is None else ctx.getWriter()
-
     stdoutContextWriter = ScriptContextWriter(sys.stdout)
+    objectService = context.service(ObjectService)
+    objectService.addObject(
+        PythonScriptRunner(stdoutContextWriter), "PythonScriptRunner"
+    )
 
-    @JImplements("java.util.function.Supplier")
-    class PythonObjectSupplier:
-        def __init__(self, obj):
-            self.obj = obj
-
-        @JOverride
-        def get(self):
-            return self.obj
-
-    @JImplements("java.util.function.Function")
-    class PythonScriptRunner:
-        @JOverride
-        def apply(self, arg):
-            # Copy script bindings/vars into script locals.
-            script_locals = {}
-            for key in arg.vars.keys():
-                script_locals[key] = arg.vars[key]
-
-            stdoutContextWriter.addScriptContext(
-                threading.currentThread(), arg.scriptContext
-            )
-
-            return_value = None
-            with redirect_stdout(stdoutContextWriter):
-                try:
-                    # NB: Execute the block, except for the last statement,
-                    # which we evaluate instead to get its return value.
-                    # Credit: https://stackoverflow.com/a/39381428/1207769
-
-                    block = ast.parse(str(arg.script), mode="exec")
-                    last = None
-                    if (
-                        len(block.body) > 0
-                        and hasattr(block.body[-1], "value")
-                        and not isinstance(block.body[-1], ast.Assign)
-                    ):
-                        # Last statement looks like an expression. Evaluate!
-                        last = ast.Expression(block.body.pop().value)
-
-                    _globals = {}
-                    exec(
-                        compile(block, "<string>", mode="exec"), _globals, script_locals
-                    )
-                    if last is not None:
-                        return_value = eval(
-                            compile(last, "<string>", mode="eval"),
-                            _globals,
-                            script_locals,
-                        )
-                except Exception:
-                    error_writer = arg.scriptContext.getErrorWriter()
-                    if error_writer is not None:
-                        error_writer.write(to_java(traceback.format_exc()))
-
-            stdoutContextWriter.removeScriptContext(threading.currentThread())
-
-            # Copy script locals back into script bindings/vars.
-            for key in script_locals.keys():
-                try:
-                    arg.vars[key] = to_java(script_locals[key])
-                except Exception:
-                    arg.vars[key] = PythonObjectSupplier(script_locals[key])
-                    # error_writer = arg.scriptContext.getErrorWriter()
-                    # if error_writer is not None:
-                    #    error_writer.write(to_java(traceback.format_exc()))
-
-            return to_java(return_value)
 
-    objectService = context.service(ObjectService)
-    objectService.addObject(PythonScriptRunner(), "PythonScriptRunner")
+@lru_cache(maxsize=256)
+def _compile_script(script: str):
+    """
+    Compile the given script source into a pair of code objects: one to
+    execute the block, except for the last statement, and one to evaluate
+    that last statement to get its return value (or None if the last
+    statement is not an expression). Results are cached, so that repeated
+    runs of the same script skip parsing and compilation.
+    """
+    # Credit: https://stackoverflow.com/a/39381428/1207769
+    block = ast.parse(script, mode="exec")
+    last = None
+    if (
+        len(block.body) > 0
+        and hasattr(block.body[-1], "value")
+        and not isinstance(block.body[-1], ast.Assign)
+    ):
+        # Last statement looks like an expression. Evaluate!
+        last = ast.Expression(block.body.pop().value)
+
+    exec_code = compile(block, "<string>", mode="exec")
+    eval_code = None if last is None else compile(last, "<string>", mode="eval")
+    return exec_code, eval_code
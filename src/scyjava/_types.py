@@ -2,6 +2,8 @@
 Utility functions for working with and reasoning about Java types.
 """
 
+import threading
+from functools import lru_cache
 from typing import Any, Callable, Sequence, Tuple, Union
 
 import jpype
@@ -9,6 +11,30 @@ import jpype
 from scyjava._jvm import jimport, jvm_started, start_jvm
 from scyjava.config import Mode, mode
 
+# JPype primitive types, keyed by jarray kind code.
+_jpype_kinds = {
+    "b": jpype.JByte,
+    "c": jpype.JChar,
+    "d": jpype.JDouble,
+    "f": jpype.JFloat,
+    "i": jpype.JInt,
+    "j": jpype.JLong,
+    "s": jpype.JShort,
+    "z": jpype.JBoolean,
+}
+
+# Boxed Java types used by jarray for n-d Jep arrays, resolved on first use.
+_jep_kinds = {}
+
+# Jep's own Python types, keyed by name, resolved by _is_jep_type on first use.
+_jep_types = {}
+
+# Per-thread (StringWriter, PrintWriter) pair reused by jstacktrace.
+_stacktrace_writers = threading.local()
+
+# NB: Passing a tuple to isinstance dispatches once at the C level.
+_JAVA_TYPES = (jpype.JClass, jpype.JObject)
+
 
 class JavaClasses:
     """
@@ -37,26 +63,49 @@ class JavaClasses:
             return jc.Integer.parseInt(s)
     """
 
-    def java_import(func: Callable[[], str]) -> property:
+    def java_import(func: Callable[[], str]) -> "_JavaImport":
         """
         A decorator used to lazily evaluate a java import.
         func is a function of a Python class that takes no arguments and
         returns a string identifying a Java class by name.
 
-        Using that function, this decorator creates a property
-        that when called, imports the class identified by the function.
+        Using that function, this decorator creates a property-like attribute
+        that when accessed, imports the class identified by the function.
+        The imported class is then cached on the instance, so that
+        subsequent accesses are plain attribute lookups.
         """
+        return _JavaImport(func)
 
-        @property
-        def inner(self):
-            if not jvm_started():
-                raise Exception()
-            try:
-                return jimport(func(self))
-            except TypeError:
-                return None
 
-        return inner
+class _JavaImport:
+    """
+    The attribute created by JavaClasses.java_import.
+
+    This is a non-data descriptor (it has no __set__), so once the imported
+    class is stored in the instance __dict__, it takes precedence over the
+    descriptor, and the import logic is never invoked again.
+    """
+
+    def __init__(self, func: Callable[[], str]):
+        self._func = func
+        self._name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        if not jvm_started():
+            raise Exception()
+        try:
+            jtype = jimport(self._func(obj))
+        except TypeError:
+            # NB: Remember the failure too, rather than retrying each time.
+            jtype = None
+        obj.__dict__[self._name] = jtype
+        return jtype
 
 
 def jclass(data):
@@ -83,6 +132,9 @@ def jclass(data):
     """
     if isinstance(data, str):
         # Name of a class -- case (A) above.
+        if mode == Mode.JPYPE:
+            # NB: Skip re-dispatch; jimport yields a static-style class.
+            return jimport(data).class_
         return jclass(jimport(data))
 
     if mode == Mode.JPYPE:
@@ -91,7 +143,7 @@ def jclass(data):
             # JPype object representing a static-style class -- case (B) above.
             return data.class_
     elif mode == Mode.JEP:
-        if str(type(data.getClass())) == "<class 'jep.PyJClass'>":
+        if _is_jep_type(data.getClass(), "PyJClass"):
             # Jep object representing a static-style class -- case (B) above.
             raise ValueError(
                 "Jep does not support Java class objects "
@@ -123,22 +175,32 @@ def jstacktrace(exc) -> str:
     if no stack trace could be extracted.
     """
     try:
-        StringWriter = jimport("java.io.StringWriter")
-        PrintWriter = jimport("java.io.PrintWriter")
-        sw = StringWriter()
-        exc.printStackTrace(PrintWriter(sw, True))
+        writers = getattr(_stacktrace_writers, "pair", None)
+        if writers is None:
+            sw = _jc.StringWriter()
+            writers = _stacktrace_writers.pair = (sw, _jc.PrintWriter(sw, True))
+        sw, pw = writers
+        sw.getBuffer().setLength(0)
+        exc.printStackTrace(pw)
         return str(sw)
     except BaseException:
         return ""
 
 
-def isjava(data) -> bool:
-    """Return whether the given data object is a Java object."""
-    if mode == Mode.JEP:
+# NB: The bridge mode is fixed at import time, so the functions below are
+# specialized per mode up front, rather than checking the mode on every call.
+
+if mode == Mode.JEP:
+
+    def isjava(data) -> bool:
+        """Return whether the given data object is a Java object."""
         return jinstance(data, "java.lang.Object")
 
-    assert mode == Mode.JPYPE
-    return isinstance(data, jpype.JClass) or isinstance(data, jpype.JObject)
+else:
+
+    def isjava(data) -> bool:
+        """Return whether the given data object is a Java object."""
+        return isinstance(data, _JAVA_TYPES)
 
 
 def is_jbyte(the_type: type) -> bool:
@@ -173,31 +235,41 @@ def is_jcharacter(the_type: type) -> bool:
     return _is_jtype(the_type, "java.lang.Character")
 
 
-def is_jarray(data: Any) -> bool:
-    """Return whether the given data object is a Java array."""
-    if mode == Mode.JEP:
-        return str(type(data)) == "<class 'jep.PyJArray'>"
+if mode == Mode.JEP:
 
-    assert mode == Mode.JPYPE
-    return isinstance(data, jpype.JArray)
+    def is_jarray(data: Any) -> bool:
+        """Return whether the given data object is a Java array."""
+        return _is_jep_type(data, "PyJArray")
 
+    def jinstance(obj, jtype) -> bool:
+        """
+        Test if the given object is an instance of a particular Java type.
 
-def jinstance(obj, jtype) -> bool:
-    """
-    Test if the given object is an instance of a particular Java type.
+        :param obj: The object to check.
+        :param jtype: The Java type, as either a jimported class or as a string.
+        :return: True iff the object is an instance of that Java type.
+        """
+        if isinstance(jtype, str):
+            jtype = jimport(jtype)
+        return isinstance(obj, jtype.__pytype__)
 
-    :param obj: The object to check.
-    :param jtype: The Java type, as either a jimported class or as a string.
-    :return: True iff the object is an instance of that Java type.
-    """
-    if isinstance(jtype, str):
-        jtype = jimport(jtype)
+else:
 
-    if mode == Mode.JEP:
-        return isinstance(obj, jtype.__pytype__)
+    def is_jarray(data: Any) -> bool:
+        """Return whether the given data object is a Java array."""
+        return isinstance(data, jpype.JArray)
+
+    def jinstance(obj, jtype) -> bool:
+        """
+        Test if the given object is an instance of a particular Java type.
 
-    assert mode == Mode.JPYPE
-    return isinstance(obj, jtype)
+        :param obj: The object to check.
+        :param jtype: The Java type, as either a jimported class or as a string.
+        :return: True iff the object is an instance of that Java type.
+        """
+        if isinstance(jtype, str):
+            jtype = jimport(jtype)
+        return isinstance(obj, jtype)
 
 
 def jarray(kind, lengths: Sequence):
@@ -224,61 +296,76 @@ def jarray(kind, lengths: Sequence):
         kind = kind.lower()
     if isinstance(lengths, int):
         lengths = [lengths]
-    arraytype = kind
 
     if mode == Mode.JEP:
         import jep  # noqa: F401
 
         if len(lengths) == 1:
             # Fast case: 1-d array (we can use primitives)
-            arr = jep.jarray(lengths[0], arraytype)
-        else:
-            # Slow case: n-d array (we cannot use primitives)
-            # See https://github.com/ninia/jep/issues/439
-            kinds = {
-                "b": jimport("java.lang.Byte"),
-                "c": jimport("java.lang.Character"),
-                "d": jimport("java.lang.Double"),
-                "f": jimport("java.lang.Float"),
-                "i": jimport("java.lang.Integer"),
-                "j": jimport("java.lang.Long"),
-                "s": jimport("java.lang.Short"),
-                "z": jimport("java.lang.Boolean"),
-            }
-            if arraytype in kinds:
-                arraytype = kinds[arraytype]
-                kind = arraytype
-            # build up the array type
-            for _ in range(len(lengths) - 1):
-                arraytype = jep.jarray(0, arraytype)
-            # instantiate the n-dimensional array
-            arr = jep.jarray(lengths[0], arraytype)
+            return jep.jarray(lengths[0], kind)
+
+        # Slow case: n-d array (we cannot use primitives)
+        # See https://github.com/ninia/jep/issues/439
+        if not _jep_kinds:
+            _jep_kinds.update(
+                {
+                    "b": _jc.Byte,
+                    "c": _jc.Character,
+                    "d": _jc.Double,
+                    "f": _jc.Float,
+                    "i": _jc.Integer,
+                    "j": _jc.Long,
+                    "s": _jc.Short,
+                    "z": _jc.Boolean,
+                }
+            )
+        # build up the element type of each dimension, innermost first
+        elementtypes = [_jep_kinds.get(kind, kind)]
+        for _ in range(len(lengths) - 1):
+            elementtypes.append(jep.jarray(0, elementtypes[-1]))
+
+        def new_array(depth):
+            return jep.jarray(lengths[depth], elementtypes[-1 - depth])
+
+        arr = new_array(0)
+        _jarray_fill(arr, new_array, len(lengths))
+        return arr
 
     elif mode == Mode.JPYPE:
         start_jvm()
 
-        # build up the array type
-        kinds = {
-            "b": jpype.JByte,
-            "c": jpype.JChar,
-            "d": jpype.JDouble,
-            "f": jpype.JFloat,
-            "i": jpype.JInt,
-            "j": jpype.JLong,
-            "s": jpype.JShort,
-            "z": jpype.JBoolean,
-        }
-        if arraytype in kinds:
-            arraytype = kinds[arraytype]
-        for _ in range(len(lengths)):
-            arraytype = jpype.JArray(arraytype)
-        # instantiate the n-dimensional array
-        arr = arraytype(lengths[0])
-
-    if len(lengths) > 1:
-        for i in range(len(arr)):
-            arr[i] = jarray(kind, lengths[1:])
-    return arr
+        arraytype = _jpype_kinds.get(kind, kind)
+        if len(lengths) == 1:
+            return jpype.JArray(arraytype)(lengths[0])
+
+        # NB: JPype allocates the whole n-d array natively in one call,
+        # e.g. JInt[3, 7] is the equivalent of new int[3][7] in Java.
+        return arraytype[tuple(lengths)]
+
+    raise RuntimeError(f"Invalid mode: {mode}")
+
+
+def _jarray_fill(arr, new_array: Callable[[int], Any], ndims: int) -> None:
+    """
+    Instantiate the subarrays of an n-dimensional Java array, level by level.
+
+    :param arr: The outermost array, as returned by new_array(0).
+    :param new_array:
+        Function allocating an empty array for the given depth, with the
+        element type and length already resolved by the caller.
+    :param ndims: The number of dimensions of the array.
+    """
+    todo = [(arr, 1)] if ndims > 1 else []
+    while todo:
+        outer, depth = todo.pop()
+        n = len(outer)
+        if depth + 1 < ndims:
+            for i in range(n):
+                outer[i] = inner = new_array(depth)
+                todo.append((inner, depth + 1))
+        else:
+            for i in range(n):
+                outer[i] = new_array(depth)
 
 
 def numeric_bounds(
@@ -294,29 +381,30 @@ def numeric_bounds(
         The minimum and maximum values as a two-element tuple of int or float,
         or a two-element tuple of None if no known bounds.
     """
+    return _numeric_bounds(the_type)
+
+
+@lru_cache(maxsize=64)
+def _numeric_bounds(
+    the_type: type,
+) -> Union[Tuple[int, int], Tuple[float, float], Tuple[None, None]]:
     if is_jbyte(the_type):
-        Byte = jimport("java.lang.Byte")
-        return int(Byte.MIN_VALUE), int(Byte.MAX_VALUE)
+        return int(_jc.Byte.MIN_VALUE), int(_jc.Byte.MAX_VALUE)
 
     if is_jshort(the_type):
-        Short = jimport("java.lang.Short")
-        return int(Short.MIN_VALUE), int(Short.MAX_VALUE)
+        return int(_jc.Short.MIN_VALUE), int(_jc.Short.MAX_VALUE)
 
     if is_jinteger(the_type):
-        Integer = jimport("java.lang.Integer")
-        return int(Integer.MIN_VALUE), int(Integer.MAX_VALUE)
+        return int(_jc.Integer.MIN_VALUE), int(_jc.Integer.MAX_VALUE)
 
     if is_jlong(the_type):
-        Long = jimport("java.lang.Long")
-        return int(Long.MIN_VALUE), int(Long.MAX_VALUE)
+        return int(_jc.Long.MIN_VALUE), int(_jc.Long.MAX_VALUE)
 
     if is_jfloat(the_type):
-        Float = jimport("java.lang.Float")
-        return float(-Float.MAX_VALUE), float(Float.MAX_VALUE)
+        return float(-_jc.Float.MAX_VALUE), float(_jc.Float.MAX_VALUE)
 
     if is_jdouble(the_type):
-        Double = jimport("java.lang.Double")
-        return float(-Double.MAX_VALUE), float(Double.MAX_VALUE)
+        return float(-_jc.Double.MAX_VALUE), float(_jc.Double.MAX_VALUE)
 
     return None, None
 
@@ -329,7 +417,58 @@ def _is_jtype(the_type: type, class_name: str) -> bool:
     :param class_name: The fully qualified Java class name in string form.
     :return: True iff the type is exactly that Java type.
     """
+    if mode == Mode.JPYPE and jvm_started():
+        # NB: JPype has exactly one Python class object per Java class.
+        return the_type is jimport(class_name)
+
     # NB: Stringify the type to support both bridge modes. Ex:
     # * JPype: <java class 'java.lang.Integer'>
     # * Jep: <class 'java.lang.Integer'>
     return f"class '{class_name}'" in str(the_type)
+
+
+def _is_jep_type(obj, name: str) -> bool:
+    """
+    Test if the given object is *exactly* of the named Jep type.
+
+    :param obj: The object to check.
+    :param name: The name of the type within the jep module, e.g. PyJArray.
+    :return: True iff the object's type is that Jep type.
+    """
+    if name not in _jep_types:
+        import jep
+
+        _jep_types[name] = getattr(jep, name, None)
+    jep_type = _jep_types[name]
+    if jep_type is None:
+        # NB: This version of Jep does not expose the type; compare by name.
+        return str(type(obj)) == f"<class 'jep.{name}'>"
+    return type(obj) is jep_type
+
+
+# fmt: off
+class _JavaClasses(JavaClasses):
+    @JavaClasses.java_import
+    def Boolean(self):      return "java.lang.Boolean"     # noqa: E272
+    @JavaClasses.java_import
+    def Byte(self):         return "java.lang.Byte"        # noqa: E272
+    @JavaClasses.java_import
+    def Character(self):    return "java.lang.Character"   # noqa: E272
+    @JavaClasses.java_import
+    def Double(self):       return "java.lang.Double"      # noqa: E272
+    @JavaClasses.java_import
+    def Float(self):        return "java.lang.Float"       # noqa: E272
+    @JavaClasses.java_import
+    def Integer(self):      return "java.lang.Integer"     # noqa: E272
+    @JavaClasses.java_import
+    def Long(self):         return "java.lang.Long"        # noqa: E272
+    @JavaClasses.java_import
+    def Short(self):        return "java.lang.Short"       # noqa: E272
+    @JavaClasses.java_import
+    def PrintWriter(self):  return "java.io.PrintWriter"   # noqa: E272
+    @JavaClasses.java_import
+    def StringWriter(self): return "java.io.StringWriter"  # noqa: E272
+# fmt: on
+
+
+_jc = _JavaClasses()
@@ -3,6 +3,7 @@ Utility functions for working with and reasoning about software component versio
 """
 
 import logging
+from functools import lru_cache
 from importlib.metadata import version
 
 from scyjava._jvm import jimport
@@ -10,6 +11,9 @@ from scyjava._types import isjava
 
 _logger = logging.getLogger(__name__)
 
+# NB: Installed package metadata is read from disk on each lookup.
+_pkg_version = lru_cache(maxsize=None)(version)
+
 
 def get_version(java_class_or_python_package) -> str:
     """
@@ -33,7 +37,7 @@ def get_version(java_class_or_python_package) -> str:
         return str(VersionUtils.getVersion(java_class_or_python_package))
 
     # Assume we were given a Python package name.
-    return version(java_class_or_python_package)
+    return _pkg_version(java_class_or_python_package)
 
 
 def is_version_at_least(actual_version: str, minimum_version: str) -> bool:
@@ -4,16 +4,15 @@ import os
 import pathlib
 
 import jpype
-from jgo import maven_scijava_repository
 
 _logger = logging.getLogger(__name__)
 
 endpoints = []
-_repositories = {"scijava.public": maven_scijava_repository()}
+_repositories = None
 _verbose = 0
 _manage_deps = True
-_cache_dir = pathlib.Path.home() / ".jgo"
-_m2_repo = pathlib.Path.home() / ".m2" / "repository"
+_cache_dir = None
+_m2_repo = None
 _options = []
 _shortcuts = {}
 
@@ -40,7 +39,6 @@ def add_endpoints(*new_endpoints):
         "Deprecated method call: scyjava.config.add_endpoints(). "
         "Please modify scyjava.config.endpoints directly instead."
     )
-    global endpoints
     _logger.debug("Adding endpoints %s to %s", new_endpoints, endpoints)
     endpoints.extend(new_endpoints)
 
@@ -54,21 +52,28 @@ def get_endpoints():
         "Deprecated method call: scyjava.config.get_endpoints(). "
         "Please access scyjava.config.endpoints directly instead."
     )
-    global endpoints
     return endpoints
 
 
 def add_repositories(*args, **kwargs):
-    global _repositories
+    repositories = _ensure_repos()
     for arg in args:
-        _logger.debug("Adding repositories %s to %s", arg, _repositories)
-        _repositories.update(arg)
-    _logger.debug("Adding repositories %s to %s", kwargs, _repositories)
-    _repositories.update(kwargs)
+        _logger.debug("Adding repositories %s to %s", arg, repositories)
+        repositories.update(arg)
+    _logger.debug("Adding repositories %s to %s", kwargs, repositories)
+    repositories.update(kwargs)
 
 
 def get_repositories():
+    return _ensure_repos()
+
+
+def _ensure_repos():
     global _repositories
+    if _repositories is None:
+        from jgo import maven_scijava_repository
+
+        _repositories = {"scijava.public": maven_scijava_repository()}
     return _repositories
 
 
@@ -79,7 +84,6 @@ def set_verbose(level):
 
 
 def get_verbose():
-    global _verbose
     _logger.debug("Getting verbose level: %d", _verbose)
     return _verbose
 
@@ -91,7 +95,6 @@ def set_manage_deps(manage):
 
 
 def get_manage_deps():
-    global _manage_deps
     return _manage_deps
 
 
@@ -103,6 +106,8 @@ def set_cache_dir(dir):
 
 def get_cache_dir():
     global _cache_dir
+    if _cache_dir is None:
+        _cache_dir = pathlib.Path.home() / ".jgo"
     return _cache_dir
 
 
@@ -114,6 +119,8 @@ def set_m2_repo(dir):
 
 def get_m2_repo():
     global _m2_repo
+    if _m2_repo is None:
+        _m2_repo = pathlib.Path.home() / ".m2" / "repository"
     return _m2_repo
 
 
@@ -126,6 +133,10 @@ def add_classpath(*path):
 
         add_classpath(*find_jars('/path/to/folder-of-jars'))
 
+    Or, equivalently but without building the list of JARs first:
+
+        add_classpath_from_dir('/path/to/folder-of-jars')
+
     :param path:
         One or more file paths to add to the Java class path.
 
@@ -142,24 +153,64 @@ def add_classpath(*path):
         foo/bar/Fubar.class inside would be another way to provide the class
         foo.bar.Fubar.
     """
-    for p in path:
-        jpype.addClassPath(p)
+    add = jpype.addClassPath
+    for p in dict.fromkeys(path):
+        add(p)
+
+
+def add_classpath_from_dir(directory) -> int:
+    """
+    Add all .jar files beneath a given directory to the Java class path.
+
+    Equivalent to add_classpath(*find_jars(directory)), but each JAR is
+    added as soon as it is found, rather than collected into a list first.
+
+    :param directory: the folder to be searched
+    :return: the number of JAR files added
+    """
+    add = jpype.addClassPath
+    count = 0
+    for jar in _iter_jars(directory):
+        add(jar)
+        count += 1
+    return count
 
 
 def find_jars(directory):
     """
     Find .jar files beneath a given directory.
 
+    See also add_classpath_from_dir, to add the JARs to the class path
+    directly.
+
     :param directory: the folder to be searched
     :return: a list of JAR files
     """
-    jars = []
-    for root, _, files in os.walk(directory):
-        for f in files:
-            if f.lower().endswith(".jar"):
-                path = os.path.join(root, f)
-                jars.append(path)
-    return jars
+    return list(_iter_jars(directory))
+
+
+def _iter_jars(directory):
+    """
+    Yield the paths of .jar files beneath a given directory, as found.
+    """
+    # NB: Like os.walk: skip symlinked and unlistable dirs, in listing order.
+    stack = [directory]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    else:
+                        name = entry.name
+                        if name[-4:-3] == "." and name[-3:].lower() == "jar":
+                            yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
 
 
 def get_classpath():
@@ -225,23 +276,20 @@ def enable_remote_debugging(port: int = 8000, suspend: bool = False):
     :param suspend:
         If True, pause when starting up the JVM until a client debugger connects.
     """
-    jdwp_args = {
-        "transport": "dt_socket",
-        "server": "y",
-        "suspend": "y" if suspend else "n",
-        "address": f"localhost:{port}",
-    }
-    arg_string = ",".join(f"{k}={v}" for k, v in jdwp_args.items())
-    add_option(f"-agentlib:jdwp={arg_string}")
+    jdwp_args = (
+        "transport=dt_socket",
+        "server=y",
+        "suspend=y" if suspend else "suspend=n",
+        f"address=localhost:{port}",
+    )
+    add_option(f"-agentlib:jdwp={','.join(jdwp_args)}")
 
 
 def add_option(option):
-    global _options
     _options.append(option)
 
 
 def add_options(options):
-    global _options
     if isinstance(options, str):
         _options.append(options)
     else:
@@ -249,15 +297,12 @@ def add_options(options):
 
 
 def get_options():
-    global _options
     return _options
 
 
 def add_shortcut(k, v):
-    global _shortcuts
     _shortcuts[k] = v
 
 
 def get_shortcuts():
-    global _shortcuts
     return _shortcuts
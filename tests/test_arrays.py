@@ -8,6 +8,25 @@ class TestArrays(object):
     def test_non_primitive_jarray(self):
         pass
 
+    def test_jarray3d(self):
+        jbools = jarray("z", [2, 3, 4])
+
+        assert is_jarray(jbools)
+        assert 2 == len(jbools)
+        for plane in jbools:
+            assert is_jarray(plane)
+            assert 3 == len(plane)
+            for row in plane:
+                assert is_jarray(row)
+                assert 4 == len(row)
+                assert all(not v for v in row)
+
+        # make sure the subarrays are distinct
+        jbools[0][0][0] = True
+        assert jbools[0][0][0]
+        assert not jbools[1][0][0]
+        assert not jbools[0][1][0]
+
     def test_jarray1d_to_python(self):
         nums = [11, 6, 2, 15, 5]
         jints = jarray("i", len(nums))
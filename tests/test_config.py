@@ -0,0 +1,53 @@
+import os
+
+from scyjava import config
+
+
+class TestConfig(object):
+    """
+    Test scyjava configuration functions.
+    """
+
+    def test_find_jars(self, tmp_path):
+        """
+        Test that find_jars finds JAR files in nested directories only.
+        """
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.jar").touch()
+        (tmp_path / "a" / "UPPER.JAR").touch()
+        (tmp_path / "a" / "b" / "deep.jar").touch()
+        (tmp_path / "a" / "notes.txt").touch()
+        (tmp_path / "a" / "jar").touch()
+        (tmp_path / "dir.jar").mkdir()
+
+        jars = config.find_jars(str(tmp_path))
+
+        expected = [
+            os.path.join(tmp_path, "top.jar"),
+            os.path.join(tmp_path, "a", "UPPER.JAR"),
+            os.path.join(tmp_path, "a", "b", "deep.jar"),
+        ]
+        assert sorted(expected) == sorted(jars)
+
+    def test_find_jars_missing_directory(self, tmp_path):
+        """
+        Test that find_jars returns nothing for a nonexistent directory.
+        """
+        assert [] == config.find_jars(str(tmp_path / "missing"))
+
+    def test_add_classpath_from_dir(self, tmp_path):
+        """
+        Test that add_classpath_from_dir adds every JAR that find_jars finds.
+        """
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "one.jar").touch()
+        (tmp_path / "sub" / "two.jar").touch()
+        (tmp_path / "sub" / "three.txt").touch()
+
+        jars = config.find_jars(str(tmp_path))
+        assert 2 == len(jars)
+        assert len(jars) == config.add_classpath_from_dir(str(tmp_path))
+
+        classpath = config.get_classpath()
+        for jar in jars:
+            assert jar in classpath
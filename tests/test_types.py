@@ -1,4 +1,4 @@
-from scyjava import numeric_bounds, to_java
+from scyjava import jimport, jstacktrace, numeric_bounds, to_java
 
 
 class TestTypes(object):
@@ -30,3 +30,14 @@ class TestTypes(object):
             type(v_double)
         )
         assert (None, None) == numeric_bounds(type(v_bigdec))
+
+    def test_jstacktrace(self):
+        """
+        Test that consecutive stack traces do not bleed into each other.
+        """
+        IllegalStateException = jimport("java.lang.IllegalStateException")
+        first = jstacktrace(IllegalStateException("first problem"))
+        second = jstacktrace(IllegalStateException("second problem"))
+        assert first.startswith("java.lang.IllegalStateException: first problem")
+        assert second.startswith("java.lang.IllegalStateException: second problem")
+        assert "first problem" not in second